@@ -1,24 +1,86 @@
+import hashlib
 import json
 import requests
-from flask import Flask, render_template, request, jsonify
+from pathlib import Path
+from flask import Flask, render_template, request, jsonify, send_from_directory
 
 app = Flask(__name__)
 
+BASE_DIR = Path(__file__).resolve().parent
+DATA_FILE = BASE_DIR / 'data' / 'politicians.json'
+
+# Static HTML written by scripts/scraping/prerender_pages.py after combine_data.py runs
+PRERENDER_DIR = BASE_DIR / 'prerendered'
+MANIFEST_NAME = 'manifest.json'
+
+# (key, files), replaced in a single assignment so threads never see a mixed pair
+_manifest_cache = (None, set())
+
+def prerendered_files():
+    """Returns the set of pre-rendered files that are safe to serve.
+
+    The manifest is only trusted while politicians.json still matches the data
+    it was built from; otherwise every page falls back to dynamic rendering.
+    The result is cached until either file changes on disk.
+    """
+    global _manifest_cache
+    try:
+        manifest_stat = (PRERENDER_DIR / MANIFEST_NAME).stat()
+        data_stat = DATA_FILE.stat()
+    except OSError:
+        return set()
+
+    key = (manifest_stat.st_mtime_ns, manifest_stat.st_size,
+           data_stat.st_mtime_ns, data_stat.st_size)
+    cached_key, cached_files = _manifest_cache
+    if cached_key == key:
+        return cached_files
+
+    files = set()
+    try:
+        with open(PRERENDER_DIR / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        data_hash = hashlib.sha256(DATA_FILE.read_bytes()).hexdigest()
+        if manifest.get('dataHash') == data_hash:
+            files.add(manifest['index'])
+            files.update(entry['file'] for entry in manifest['politicians'].values())
+        else:
+            app.logger.warning("Pre-rendered pages are out of date with %s; rendering dynamically.", DATA_FILE)
+    except (OSError, ValueError, KeyError) as e:
+        app.logger.warning("Could not read pre-render manifest: %s", e)
+
+    _manifest_cache = (key, files)
+    return files
+
+def send_prerendered(relative_path):
+    """Returns the pre-rendered page if the current manifest lists it, otherwise None."""
+    if relative_path not in prerendered_files():
+        return None
+    return send_from_directory(PRERENDER_DIR, relative_path)
+
 # Load politicians data
 def load_politicians():
     try:
-        with open('data/politicians.json', 'r', encoding='utf-8') as f:
+        with open(DATA_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     except:
         return []
 
 @app.route('/')
 def index():
+    prerendered = send_prerendered('index.html')
+    if prerendered is not None:
+        return prerendered
+
     politicians = load_politicians()
     return render_template('index.html', politicians=politicians)
 
 @app.route('/politician/<politician_id>')
 def politician_detail(politician_id):
+    prerendered = send_prerendered(f'politician/{politician_id}.html')
+    if prerendered is not None:
+        return prerendered
+
     politicians = load_politicians()
     politician = next((p for p in politicians if p['id'] == politician_id), None)
     
@@ -33,14 +33,30 @@ def main():
         
     all_politicians = house_of_representatives_data + house_of_councilors_data
     
-    if all_politicians:
-        # Use the updated save_data_to_json from common utils
-        # It now calculates the path relative to PROJECT_ROOT internally
-        save_data_to_json(all_politicians, "politicians.json") 
-    else:
+    if not all_politicians:
         print("No data to combine. politicians.json not created/updated.")
+        print("Data combining complete.")
+        return False
         
+    # Use the updated save_data_to_json from common utils
+    # It now calculates the path relative to PROJECT_ROOT internally
+    save_data_to_json(all_politicians, "politicians.json") 
     print("Data combining complete.")
+    
+    prerender()
+    return True
+
+def prerender():
+    """Refreshes the static politician pages from the newly combined roster.
+
+    politicians.json is already saved at this point, so a failure here is only
+    reported; the app falls back to dynamic rendering until the next build.
+    """
+    try:
+        import prerender_pages
+        prerender_pages.main()
+    except Exception as e:
+        print(f"Warning: pre-rendering politician pages failed: {type(e).__name__}: {e}")
 
 if __name__ == "__main__":
     main()
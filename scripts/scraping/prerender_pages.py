@@ -0,0 +1,140 @@
+import hashlib
+import json
+import sys
+
+# Use PROJECT_ROOT defined in common_scraper_utils
+from common_scraper_utils import PROJECT_ROOT
+
+# app.py lives at the project root, so make it importable from scripts/scraping/
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import app as flask_app
+from app import app
+
+DETAIL_TEMPLATE = "politician_detail.html"
+INDEX_TEMPLATE = "index.html"
+
+def record_hash(data):
+    """Returns a stable hash of a JSON-serialisable record."""
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def base_url():
+    """Builds the URL url_for() renders against, from the app's deployment config."""
+    host = app.config.get("SERVER_NAME") or "localhost"
+    root = app.config["APPLICATION_ROOT"].lstrip('/')
+    return f"{app.config['PREFERRED_URL_SCHEME']}://{host}/{root}"
+
+def render_hash(url):
+    """Hashes every template the app can load plus the base URL.
+
+    Pages pull in parents and includes (e.g. base.html), so any template edit
+    or deployment prefix change invalidates every pre-rendered page.
+    """
+    digest = hashlib.sha256(url.encode('utf-8'))
+    for name in sorted(app.jinja_env.list_templates()):
+        source, _, _ = app.jinja_env.loader.get_source(app.jinja_env, name)
+        digest.update(name.encode('utf-8'))
+        digest.update(source.encode('utf-8'))
+    return digest.hexdigest()
+
+def load_manifest(manifest_file):
+    """Loads the manifest from the previous build, or an empty one."""
+    if not manifest_file.exists():
+        return {}
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"Warning: could not read {manifest_file} ({e}); re-rendering everything.")
+            return {}
+
+def write_atomically(file_path, text):
+    """Writes via a temp file so a file server never sees a half-written file."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    tmp_path.write_text(text, encoding='utf-8')
+    tmp_path.replace(file_path)
+
+def render_to_file(template_name, file_path, url, **context):
+    """Renders a template outside of a real request and writes it to disk."""
+    # A request context lets templates use url_for() as they would at runtime
+    with app.test_request_context(base_url=url):
+        html = app.jinja_env.get_template(template_name).render(**context)
+    write_atomically(file_path, html)
+
+def main(data_file=None, output_dir=None):
+    """Renders the index and every detail page, skipping unchanged members.
+
+    Returns the manifest that was written, or None if there was no data.
+    """
+    print("Pre-rendering politician pages...")
+
+    data_file = data_file or flask_app.DATA_FILE
+    output_dir = output_dir or flask_app.PRERENDER_DIR
+    manifest_file = output_dir / flask_app.MANIFEST_NAME
+
+    if not data_file.exists():
+        print(f"Error: Data file not found at {data_file}")
+        return None
+
+    data_bytes = data_file.read_bytes()
+    politicians = json.loads(data_bytes.decode('utf-8'))
+
+    previous = load_manifest(manifest_file)
+    previous_pages = previous.get("politicians", {})
+
+    url = base_url()
+    current_render_hash = render_hash(url)
+    # Any template or base URL change invalidates every previously rendered page
+    render_changed = previous.get("renderHash") != current_render_hash
+
+    pages = {}
+    rendered = 0
+    for politician in politicians:
+        politician_id = politician['id']
+        relative_path = f"politician/{politician_id}.html"
+        file_path = output_dir / relative_path
+        digest = record_hash(politician)
+
+        entry = previous_pages.get(politician_id)
+        if (render_changed or entry is None or entry.get("hash") != digest
+                or not file_path.exists()):
+            render_to_file(DETAIL_TEMPLATE, file_path, url, politician=politician)
+            rendered += 1
+
+        pages[politician_id] = {"file": relative_path, "hash": digest}
+
+    index_file = output_dir / "index.html"
+    roster_hash = record_hash(politicians)
+    if render_changed or previous.get("indexHash") != roster_hash or not index_file.exists():
+        render_to_file(INDEX_TEMPLATE, index_file, url, politicians=politicians)
+        print(f"Rendered {index_file}")
+
+    manifest = {
+        # The app only trusts this manifest while politicians.json still matches dataHash
+        "dataHash": hashlib.sha256(data_bytes).hexdigest(),
+        "renderHash": current_render_hash,
+        "baseUrl": url,
+        "index": "index.html",
+        "indexHash": roster_hash,
+        "politicians": pages,
+    }
+    write_atomically(manifest_file, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+    # Remove pages for members who are no longer on the roster. The new manifest
+    # is already in place, so the app stops serving them even if this fails.
+    removed = 0
+    for politician_id, entry in previous_pages.items():
+        if politician_id not in pages:
+            (output_dir / entry["file"]).unlink(missing_ok=True)
+            removed += 1
+
+    print(f"Rendered {rendered} of {len(pages)} detail pages, removed {removed} stale pages.")
+    print(f"Saved manifest to {manifest_file}")
+    print("Pre-rendering complete.")
+    return manifest
+
+if __name__ == "__main__":
+    main()
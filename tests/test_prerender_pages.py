@@ -0,0 +1,121 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from jinja2 import FileSystemLoader
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts" / "scraping"))
+
+import app as flask_app
+import prerender_pages
+
+TEMPLATES = {
+    "base.html": "<title>{% block title %}{% endblock %}</title>{% block content %}{% endblock %}",
+    "index.html": (
+        '{% extends "base.html" %}{% block content %}'
+        "{% for p in politicians %}<a href=\"{{ url_for('politician_detail', politician_id=p.id) }}\">"
+        "{{ p.name }}</a>{% endfor %}{% endblock %}"
+    ),
+    "politician_detail.html": '{% extends "base.html" %}{% block content %}{{ politician.name }}{% endblock %}',
+}
+
+ROSTER = [
+    {"id": "hr-001", "name": "Alpha", "chamber": "衆議院"},
+    {"id": "hc-002", "name": "Beta", "chamber": "参議院"},
+]
+
+@pytest.fixture
+def build(tmp_path, monkeypatch):
+    """Points the build at temporary templates, data and output, and records renders."""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    for name, source in TEMPLATES.items():
+        (template_dir / name).write_text(source, encoding="utf-8")
+    monkeypatch.setattr(flask_app.app.jinja_env, "loader", FileSystemLoader(str(template_dir)))
+    flask_app.app.jinja_env.cache.clear()
+
+    data_file = tmp_path / "politicians.json"
+    output_dir = tmp_path / "prerendered"
+    monkeypatch.setattr(flask_app, "DATA_FILE", data_file)
+    monkeypatch.setattr(flask_app, "PRERENDER_DIR", output_dir)
+
+    rendered = []
+    real_render = prerender_pages.render_to_file
+
+    def spy(template_name, file_path, *args, **kwargs):
+        rendered.append(file_path.relative_to(output_dir).as_posix())
+        return real_render(template_name, file_path, *args, **kwargs)
+
+    monkeypatch.setattr(prerender_pages, "render_to_file", spy)
+
+    def run(roster):
+        data_file.write_text(json.dumps(roster, ensure_ascii=False), encoding="utf-8")
+        rendered.clear()
+        prerender_pages.main()
+        flask_app.app.jinja_env.cache.clear()
+        return sorted(rendered)
+
+    run.template_dir = template_dir
+    run.output_dir = output_dir
+    yield run
+    flask_app.app.jinja_env.cache.clear()
+
+def test_first_build_writes_pages_and_manifest(build):
+    assert build(ROSTER) == ["index.html", "politician/hc-002.html", "politician/hr-001.html"]
+
+    manifest = json.loads((build.output_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["index"] == "index.html"
+    assert manifest["baseUrl"] == "http://localhost/"
+    assert manifest["politicians"]["hr-001"] == {
+        "file": "politician/hr-001.html",
+        "hash": prerender_pages.record_hash(ROSTER[0]),
+    }
+    assert "Alpha" in (build.output_dir / "politician" / "hr-001.html").read_text(encoding="utf-8")
+    assert "/politician/hc-002" in (build.output_dir / "index.html").read_text(encoding="utf-8")
+
+def test_unchanged_build_renders_nothing(build):
+    build(ROSTER)
+    assert build(ROSTER) == []
+
+def test_only_changed_records_are_rerendered(build):
+    build(ROSTER)
+    changed = [dict(ROSTER[0], party="自民"), ROSTER[1]]
+    assert build(changed) == ["index.html", "politician/hr-001.html"]
+
+def test_missing_file_is_rerendered(build):
+    build(ROSTER)
+    (build.output_dir / "politician" / "hc-002.html").unlink()
+    assert build(ROSTER) == ["politician/hc-002.html"]
+
+def test_parent_template_change_rerenders_everything(build):
+    build(ROSTER)
+    (build.template_dir / "base.html").write_text("<h1>new layout</h1>{% block content %}{% endblock %}", encoding="utf-8")
+    assert build(ROSTER) == ["index.html", "politician/hc-002.html", "politician/hr-001.html"]
+
+def test_base_url_change_rerenders_everything(build, monkeypatch):
+    build(ROSTER)
+    monkeypatch.setitem(flask_app.app.config, "APPLICATION_ROOT", "/manifesto")
+    assert build(ROSTER) == ["index.html", "politician/hc-002.html", "politician/hr-001.html"]
+    assert "/manifesto/politician/hr-001" in (build.output_dir / "index.html").read_text(encoding="utf-8")
+
+def test_members_who_left_are_removed(build):
+    build(ROSTER)
+    assert build(ROSTER[:1]) == ["index.html"]
+    assert not (build.output_dir / "politician" / "hc-002.html").exists()
+    manifest = json.loads((build.output_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert list(manifest["politicians"]) == ["hr-001"]
+
+def test_app_serves_only_pages_listed_for_current_data(build):
+    build(ROSTER)
+    client = flask_app.app.test_client()
+    (build.output_dir / "politician" / "hr-001.html").write_text("from disk", encoding="utf-8")
+    assert client.get("/politician/hr-001").data == b"from disk"
+
+    # politicians.json changed without a rebuild: the manifest no longer matches
+    (build.output_dir / "politician" / "hc-002.html").write_text("stale", encoding="utf-8")
+    flask_app.DATA_FILE.write_text(json.dumps(ROSTER[:1]), encoding="utf-8")
+    assert client.get("/politician/hr-001").data != b"from disk"
+    assert client.get("/politician/hc-002").status_code == 404